@@ -1,11 +1,19 @@
-import configparser
+import hashlib
+import json
 import os
+import re
 import shlex
 import subprocess
-from os import listdir
-from os.path import expanduser, isdir, join
+import sys
+import tempfile
+import time
+import unicodedata
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from os.path import basename, dirname, expanduser, isdir, join
 from shutil import which
-from typing import Dict, List, Union, Generator, Optional, Iterable, Tuple
+from threading import Event, Lock, Thread
+from typing import Dict, List, Union, Generator, Optional, Iterable, Iterator, NamedTuple, Tuple
 from functools import lru_cache
 import psutil
 from langcodes import closest_match
@@ -13,14 +21,228 @@ from ovos_bus_client.message import Message
 from ovos_utils.bracket_expansion import expand_template
 from ovos_utils.lang import standardize_lang_tag
 from ovos_utils.log import LOG
-from ovos_utils.parse import match_one, fuzzy_match
+from ovos_utils.xdg_utils import xdg_cache_home
 from ovos_workshop.decorators import fallback_handler
 from ovos_workshop.skills.fallback import FallbackSkill
 from padacioso import IntentContainer
+from rapidfuzz import fuzz, process
 
 WindowMatch = Tuple[str, psutil.Process, float, str]  # for easy typing
 
 
+class AppIndex(NamedTuple):
+    """Known applications and their lookup structures, replaced as a whole on every rescan.
+
+    Readers take a single reference to the index, a concurrent rescan can't mix an old and a new index.
+    """
+    apps: Dict[str, str]  # application names and aliases -> command
+    folded: Dict[str, str]  # folded names and words unique to one command -> command
+    choices: Dict[int, List[str]]  # folded full names bucketed by length, for fuzzy matching
+    prefixes: List[str]  # sorted folded names, for prefix matching
+    argv: Dict[str, List[str]]  # command -> tokenized command
+    fuzzy_cache: Dict[Tuple[str, float], Tuple[Optional[str], float]]  # fuzzy matching results of this index
+
+# standard locations of .desktop files
+APPLICATION_DIRS = ["/usr/share/applications/", "/usr/local/share/applications/",
+                    "~/.local/share/applications/"]
+CACHE_DIR = "ovos_skill_application_launcher"
+# bumped whenever the format of the cached application commands changes
+_APPLIST_CACHE_VERSION = 2
+# escape sequences of desktop entry string values
+_STRING_ESCAPES = {"s": " ", "n": "\n", "t": "\t", "r": "\r", "\\": "\\"}
+# characters that are escaped with a backslash inside a quoted Exec argument
+_EXEC_QUOTE_ESCAPES = frozenset('"`$\\')
+# env options that take a value, eg. "env -u VAR app"
+_ENV_VALUE_OPTIONS = frozenset(("-u", "--unset", "-C", "--chdir"))
+# combining diacritics of latin, greek and cyrillic letters, stripped for accent insensitive matching
+# marks of other scripts (eg. devanagari virama and nukta) distinguish letters and are kept
+_DIACRITICS = re.compile("[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]")
+# separators replaced by spaces in application names
+_NAME_SEPARATORS = str.maketrans("-_", "  ")
+# answers that end a confirmation prompt
+_YES_NO = frozenset(("yes", "no"))
+
+# compiled intent containers, shared between skill instances, keyed by a digest of the .intent files
+_INTENT_CACHE: Dict[str, IntentContainer] = {}
+# parsed .desktop files keyed by path, only reparsed when the file mtime (or the requested langs) change
+_DESKTOP_CACHE: Dict[str, Tuple[Tuple[int, Tuple[str, ...]], Dict[str, Union[str, List[str]]]]] = {}
+
+
+@lru_cache(1024)
+def _normalize_name(name: str) -> str:
+    """Speech friendly version of an application name, eg. "org.gnome.system-monitor" -> "System Monitor"."""
+    if name.endswith(".desktop"):
+        name = name[:-8]
+    return name.translate(_NAME_SEPARATORS).rsplit(".", 1)[-1].title()
+
+
+def _parse_exec(exec_line: str) -> List[str]:
+    """Split the Exec key of a .desktop file into arguments, following the desktop entry spec.
+
+    Field codes are dropped since applications are launched without files or urls, "%%" is a literal "%".
+
+    Args:
+        exec_line: The raw value of the Exec key.
+
+    Returns:
+        The command line arguments, eg. 'firefox --name="My Firefox" %u' -> ["firefox", "--name=My Firefox"].
+
+    Raises:
+        ValueError: if a quoted argument is not terminated.
+    """
+    # Exec is a string value, its general escapes (\s, \\, ...) are resolved before the quoting rules
+    line = re.sub(r"\\(.)", lambda m: _STRING_ESCAPES.get(m.group(1), m.group(0)), exec_line)
+    argv: List[str] = []
+    arg: List[str] = []
+    in_arg = quoted = False
+    chars = iter(line)
+    for c in chars:
+        if quoted:
+            if c == '"':
+                quoted = False
+            elif c == "\\":
+                nxt = next(chars, "")
+                arg.append(nxt if nxt in _EXEC_QUOTE_ESCAPES else c + nxt)
+            elif c == "%":
+                nxt = next(chars, "")
+                arg.append("%" if nxt == "%" else c + nxt)
+            else:
+                arg.append(c)
+        elif c == '"':
+            quoted = in_arg = True
+        elif c in " \t\n":
+            if in_arg:
+                argv.append("".join(arg))
+                arg, in_arg = [], False
+        elif c == "%":
+            if next(chars, "") == "%":
+                arg.append("%")
+                in_arg = True
+            # any other field code expands to nothing, an argument made only of a field code is dropped
+        else:
+            arg.append(c)
+            in_arg = True
+    if quoted:
+        raise ValueError(f"unterminated quote in Exec: {exec_line}")
+    if in_arg:
+        argv.append("".join(arg))
+    return argv
+
+
+def _executable_name(argv: List[str]) -> str:
+    """Name of the application executable in a command, looking through "env" and "flatpak run" wrappers.
+
+    eg. ["env", "FOO=1", "/opt/foo/foo.bin"] -> "foo", ["flatpak", "run", "org.mozilla.firefox"] -> "firefox"
+    """
+    args = list(argv)
+    if args and basename(args[0]) == "env":
+        args = args[1:]
+        # options and NAME=VALUE assignments preceding the command
+        while args and (args[0].startswith("-") or "=" in args[0]):
+            args = args[2:] if args[0] in _ENV_VALUE_OPTIONS else args[1:]
+    if len(args) > 1 and basename(args[0]) == "flatpak" and args[1] == "run":
+        command = None
+        for arg in args[2:]:
+            if arg.startswith("--command="):
+                command = arg.split("=", 1)[1]
+            elif not arg.startswith("-"):
+                # without an explicit command use the last component of the application id
+                args = [command or arg.rsplit(".", 1)[-1]]
+                break
+    if not args:
+        return ""
+    return basename(args[0]).split(".")[0]
+
+
+def _fold(text: str) -> str:
+    """Case and accent insensitive form of a name, eg. "Écran" -> "ecran", used as key of the exact match index."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    # recompose whatever wasn't stripped, eg. hangul syllables
+    return unicodedata.normalize("NFC", _DIACRITICS.sub("", text))
+
+
+@lru_cache(256)
+def _standardize_lang(lang: str) -> str:
+    """Memoized standardize_lang_tag, the same few tags are repeated across every .desktop file."""
+    return standardize_lang_tag(lang)
+
+
+@lru_cache(16)
+def _desktop_keys(extra_langs: Tuple[str, ...]) -> frozenset:
+    """Keys parsed from .desktop files, including the localized variants of the requested languages."""
+    keys_of_interest = {
+        'Name',
+        'GenericName',
+        "Categories",
+        "Comment",
+        'Keywords',
+        "Exec",
+        "Type",
+        #   'MimeType', # for future usage
+        'Icon',  # future usage in a UI
+        #   'DBusActivatable'  # for future usage instead of subprocess
+    }
+    for l in map(_standardize_lang, extra_langs):
+        keys_of_interest.update({f"Name[{l}]", f"GenericName[{l}]", f"Comment[{l}]"})
+    return frozenset(keys_of_interest)
+
+
+@lru_cache(512)
+def _calc_intent(matcher: IntentContainer, utterance: str) -> Optional[Dict]:
+    """Cached intent matching, shared by all skill instances since matchers are shared too."""
+    return matcher.calc_intent(utterance)
+
+
+def _iter_samples(text: str) -> Iterator[str]:
+    """Lazily expand the templates of a .intent file, skipping comments and empty lines."""
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield from expand_template(line)
+
+
+def _write_cache(cache_file: str, data: bytes) -> None:
+    """Atomically replace a cache file, readers never see a partially written file.
+
+    Args:
+        cache_file: Path of the cache file, parent directories are created as needed.
+        data: The serialized cache contents.
+    """
+    os.makedirs(dirname(cache_file), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=dirname(cache_file), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, cache_file)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _get_intent_container(intent_files: Dict[str, str]) -> IntentContainer:
+    """Get the compiled intent container for a set of .intent files, from memory or by building it.
+
+    Args:
+        intent_files: Mapping of intent names to their .intent file paths.
+
+    Returns:
+        An IntentContainer with all the intents registered.
+    """
+    key = hashlib.sha1(json.dumps(sorted((name, path, os.stat(path).st_mtime_ns)
+                                         for name, path in intent_files.items())).encode("utf-8")).hexdigest()
+    if key in _INTENT_CACHE:
+        return _INTENT_CACHE[key]
+
+    container = IntentContainer()
+    for intent_name, path in intent_files.items():
+        with open(path) as f:
+            # bracket expansion can produce many duplicates, only register unique samples
+            samples = {option.strip() for option in _iter_samples(f.read()) if option.strip()}
+        container.add_intent(intent_name, list(samples))
+    _INTENT_CACHE[key] = container
+    return container
+
+
 class ApplicationLauncherSkill(FallbackSkill):
     """Skill to handle launching and closing desktop applications via voice commands."""
 
@@ -45,55 +267,77 @@ class ApplicationLauncherSkill(FallbackSkill):
                 LOG.debug(f"'wmctrl' found: {self.wmctrl}")
         else:
             LOG.debug(f"window manager disabled for {self.skill_id}")
-
-        self.applist = self.get_app_aliases()
+        # short lived cache of the window list, avoids calling wmctrl repeatedly during a single interaction
+        self._wmcache: List[WindowMatch] = []
+        self._wmcache_t = 0.0
+
+        # empty until the first scan finishes, scanning .desktop files must not block skill loading
+        self._index = AppIndex({}, {}, {}, [], {}, {})
+        # mtimes of the application dirs at the last successful scan, None if there is none
+        self._apps_mtime: Optional[Tuple[Tuple[str, int], ...]] = None
+        self._apps_ready = Event()
+        # serializes rescans, concurrent requests wait for the running rescan instead of repeating it
+        self._apps_lock = Lock()
+        Thread(target=self._load_apps, daemon=True).start()
         # this is a regex based intent parser
         # we handle this in fallback stage to
         # allow more control over matching application names
-        self.intent_matchers = {}
+        self.intent_matchers: Dict[str, IntentContainer] = {}
+        self._intent_files: Dict[str, Dict[str, str]] = {}
+        self._lang_cache: Dict[str, Optional[str]] = {}
         self.register_fallback_intents()
         self.add_event(f"{self.skill_id}.async_prompt", self.handle_async_prompt)
+        self.add_event(f"{self.skill_id}.refresh_apps", self.handle_refresh_apps)
 
-    @lru_cache(10)
     def match_app(self, utterance: str, lang: str) -> Optional[Dict]:
-        best_lang, score = closest_match(lang, list(self.intent_matchers.keys()))
-        if score >= 10:
+        best_lang = self.resolve_lang(lang)
+        if best_lang is None:
             # unsupported lang
             return None
-        best_lang = standardize_lang_tag(best_lang)
-        res = self.intent_matchers[best_lang].calc_intent(utterance)
-        return res
+        # padacioso matches case insensitively, keep the casing of the extracted name for the dialogs
+        return _calc_intent(self.get_matcher(best_lang), utterance.strip())
+
+    def resolve_lang(self, lang: str) -> Optional[str]:
+        """Map a requested lang to the closest supported one (None if unsupported), cached per lang."""
+        if lang not in self._lang_cache:
+            best_lang, score = closest_match(lang, list(self._intent_files.keys()))
+            self._lang_cache[lang] = standardize_lang_tag(best_lang) if score < 10 else None
+        return self._lang_cache[lang]
+
+    def get_matcher(self, lang: str) -> IntentContainer:
+        """Get the intent matcher for a supported language, compiling it on first usage."""
+        if lang not in self.intent_matchers:
+            LOG.debug(f"'{self.skill_id}' - registering fallback '{lang}' intents: {list(self._intent_files[lang])}")
+            self.intent_matchers[lang] = _get_intent_container(self._intent_files[lang])
+        return self.intent_matchers[lang]
 
     def register_fallback_intents(self) -> None:
-        """Register fallback intents from locale files."""
+        """Find the fallback intent files of every language, matchers are only built when a language is used."""
         intents = ["close", "launch"]
-        for lang in os.listdir(f"{self.root_dir}/locale"):
-            for intent_name in intents:
-                launch = join(self.root_dir, "locale", lang, f"{intent_name}.intent")
-                if not os.path.isfile(launch):
-                    continue
-                l2 = standardize_lang_tag(lang)
-                if l2 not in self.intent_matchers:
-                    self.intent_matchers[l2] = IntentContainer()
-                LOG.debug(f"'{self.skill_id}' - registering fallback '{l2}' intent: '{intent_name}'")
-                with open(launch) as f:
-                    samples = [option for line in f.read().split("\n")
-                               if not line.startswith("#") and line.strip()
-                               for option in expand_template(line)]
-                    self.intent_matchers[l2].add_intent(intent_name, samples)
+        with os.scandir(join(self.root_dir, "locale")) as langs:
+            lang_dirs = [entry for entry in langs if entry.is_dir()]
+        for lang_dir in lang_dirs:
+            with os.scandir(lang_dir.path) as entries:
+                files = {entry.name for entry in entries if entry.is_file()}
+            intent_files = {intent_name: join(lang_dir.path, f"{intent_name}.intent")
+                            for intent_name in intents if f"{intent_name}.intent" in files}
+            if not intent_files:
+                continue
+            self._intent_files[standardize_lang_tag(lang_dir.name)] = intent_files
 
     def can_answer(self, message: Message) -> bool:
         utterance = message.data["utterances"][0]
-        res = self.match_app(utterance, self.lang)
+        res = self.match_app(utterance, self.lang) or {}
         return bool(res.get('entities', {}).get("application"))
 
     @fallback_handler(priority=4)
     def handle_fallback(self, message) -> bool:
         """Handle fallback utterances for launching and closing applications."""
         utterance = message.data.get("utterance", "")
-        res = self.match_app(utterance, self.lang)
+        res = self.match_app(utterance, self.lang) or {}
         app = res.get('entities', {}).get("application")
         if app:
+            self.refresh_applist()
             LOG.debug(f"Application name match: {res}")
             if res["name"] == "launch":
                 if self.is_running(app):
@@ -108,28 +352,31 @@ class ApplicationLauncherSkill(FallbackSkill):
         app = message.data["app"]
         # in order for fallback to not time out we can't ask user questions in the other handler
         # so we consume the utterance first, and then proceed to ask the user to clarify action
-        launch = True
         switch = False
 
         self.speak_dialog("already_running", {"application": app})
 
         if self.wmctrl and not self.settings.get("disable_window_manager", False):
-            for i in range(5):
-                if switch not in ["no", "yes"]:
-                    switch = self.ask_yesno("confirm_switch")
-                    LOG.debug(f"user confirmation: {switch}")
-                    if switch and switch == "yes":
-                        win = self.match_window(app)
-                        window_id = win[0][0] if win else None
-                        self.switch_window(window_id)
-                        return True
+            for _ in range(5):
+                switch = self.ask_yesno("confirm_switch")
+                LOG.debug(f"user confirmation: {switch}")
+                if switch in _YES_NO:
+                    break
+            if switch == "yes":
+                # windows may have been closed or opened while waiting for the answer, look them up now
+                self._wmcache_t = 0.0
+                win = self.match_window(app)
+                window_id = win[0][0] if win else None
+                self.switch_window(window_id)
+                return True
         if not switch:
-            for i in range(5):
-                if launch not in ["no", "yes"]:
-                    launch = self.ask_yesno("confirm_launch")
-                    LOG.debug(f"user confirmation: {launch}")
-                    if launch == "no":
-                        return True  # no action
+            for _ in range(5):
+                launch = self.ask_yesno("confirm_launch")
+                LOG.debug(f"user confirmation: {launch}")
+                if launch in _YES_NO:
+                    break
+            if launch == "no":
+                return True  # no action
 
         # launch
         self.launch_app(app)
@@ -143,12 +390,17 @@ class ApplicationLauncherSkill(FallbackSkill):
         Returns:
             True if the application is launched successfully, False otherwise.
         """
-        cmd, score = match_one(app.title(), self.applist)
+        # the command and its argv must come from the same index
+        index = self.get_index()
+        cmd, score = self.match_command(app, index)
         if score >= self.settings.get("thresh", 0.85):
             LOG.info(f"Matched application: {app} (command: {cmd})")
             try:
-                # Launch the application in a new process without blocking
-                subprocess.Popen(shlex.split(cmd), shell=self.settings.get("shell", False))
+                shell = self.settings.get("shell", False)
+                # Launch the application in a new session without blocking, detached from our stdio
+                subprocess.Popen(cmd if shell else index.argv[cmd], shell=shell,
+                                 start_new_session=True, close_fds=True, stdin=subprocess.DEVNULL,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 self.acknowledge()
                 return True
             except Exception as e:
@@ -171,18 +423,39 @@ class ApplicationLauncherSkill(FallbackSkill):
     #########
     # process management
     def match_process(self, app: str) -> Iterable[psutil.Process]:
-        cmd, _ = match_one(app.title(), self.applist)
-        cmd = cmd.split(" ")[0].split("/")[-1]
-
-        # Retrieve the list of processes and sort by their start time (descending order)
-        processes = sorted(psutil.process_iter(['pid', 'name', 'create_time']),
-                           key=lambda proc: proc.info['create_time'], reverse=True)
-        for proc in processes:
-            if proc.status() in ["zombie"]:
+        index = self.get_index()
+        cmd, _ = self.match_command(app, index)
+        if not cmd:
+            return
+        target = self._process_name(cmd, index)
+        matches = []
+        others = []
+        for proc in psutil.process_iter(['name', 'create_time', 'status']):
+            if proc.info['status'] == psutil.STATUS_ZOMBIE:
                 continue
-            score = fuzzy_match(cmd, proc.info['name'])
-            if score > 0.9:
-                yield proc
+            # executable names usually match exactly, a string comparison is enough
+            if (proc.info['name'] or "").casefold() == target:
+                matches.append(proc)
+            else:
+                others.append(proc)
+
+        if not matches:
+            # fall back to fuzzy matching, scored in a single batch
+            names = [(proc.info['name'] or "").casefold() for proc in others]
+            for _, score, idx in process.extract(target, names, scorer=fuzz.ratio, processor=None,
+                                                 score_cutoff=90, limit=None):
+                if score > 90:
+                    matches.append(others[idx])
+
+        # only sort the matches by their start time (descending order), most recent first
+        matches.sort(key=lambda proc: proc.info['create_time'], reverse=True)
+        yield from matches
+
+    def _process_name(self, cmd: str, index: AppIndex) -> str:
+        """Expected process name of a launch command, eg. "/usr/lib/firefox/firefox" -> "firefox"."""
+        # executable name from the pre-tokenized command, handles quoted paths with spaces
+        argv = index.argv.get(cmd) or cmd.split(" ")
+        return _executable_name(argv).casefold()
 
     def close_by_process(self, app: str) -> bool:
         """Close the application with the given name.
@@ -197,9 +470,9 @@ class ApplicationLauncherSkill(FallbackSkill):
         for proc in self.match_process(app):
             LOG.debug(f"Matched '{app}' to {proc}")
             try:
-                LOG.info(f"Terminating process: {proc.info['name']} (PID: {proc.info['pid']})")
+                LOG.info(f"Terminating process: {proc.info['name']} (PID: {proc.pid})")
                 proc.terminate()  # or process.kill() to forcefully kill
-                terminated.append(proc.info['pid'])
+                terminated.append(proc.pid)
                 if not self.settings.get("terminate_all", False):
                     break
             except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -213,10 +486,203 @@ class ApplicationLauncherSkill(FallbackSkill):
 
     #########
     # .desktop file management
+    @staticmethod
+    def get_apps_mtime() -> Tuple[Tuple[str, int], ...]:
+        """Modification times of the .desktop directories, they change when apps are (un)installed."""
+        return tuple((p, os.stat(p).st_mtime_ns) for p in map(expanduser, APPLICATION_DIRS) if isdir(p))
+
+    def _load_apps(self) -> None:
+        """Initial application scan, runs in a background thread started by initialize."""
+        try:
+            self._apps_mtime = self.get_apps_mtime()
+            self.build_applist()
+        except Exception as e:
+            LOG.exception(f"Failed to load applications: {e}")
+            # no valid mtimes, the next refresh_applist retries the scan
+            self._apps_mtime = None
+        finally:
+            self._apps_ready.set()
+
+    def refresh_applist(self) -> None:
+        """Rebuild the application aliases only if the .desktop directories changed."""
+        self._apps_ready.wait()
+        with self._apps_lock:
+            mtime = self.get_apps_mtime()
+            if mtime != self._apps_mtime:
+                LOG.debug("application directories changed, rescanning .desktop files")
+                self._apps_mtime = mtime
+                try:
+                    self.build_applist()
+                except Exception:
+                    self._apps_mtime = None  # retry on the next refresh
+                    raise
+
+    def handle_refresh_apps(self, message: Message) -> None:
+        """Force a rescan of the .desktop files, eg. after an app was edited in place."""
+        self._apps_ready.wait()
+        with self._apps_lock:
+            self._apps_mtime = self.get_apps_mtime()
+            try:
+                self.build_applist(use_cache=False)
+            except Exception:
+                self._apps_mtime = None  # retry on the next refresh
+                raise
+
+    def build_applist(self, use_cache: bool = True) -> None:
+        """Load (or scan) the application aliases and precompute the choices used for fuzzy matching."""
+        # many aliases share a command, json decoding would give each its own string copy
+        apps = {sys.intern(k): sys.intern(v) for k, v in self.load_applist(use_cache).items()}
+        # case and accent insensitive index for exact matches, skips fuzzy scoring entirely
+        folded = {sys.intern(_fold(k)): v for k, v in apps.items()}
+        # fuzzy choices bucketed by length, lets matching skip names that can't reach the threshold
+        choices: Dict[int, List[str]] = {}
+        for name in folded:
+            choices.setdefault(len(name), []).append(name)
+        # individual words of multi word names, eg. "firefox" from "Firefox Web Browser"
+        # only words unique to a single command, "browser" or "manager" may belong to several apps
+        word_cmds: Dict[str, set] = {}
+        for name, cmd in apps.items():
+            for word in _fold(name).split():
+                if len(word) >= 3:
+                    word_cmds.setdefault(word, set()).add(cmd)
+        # full names always take precedence over words
+        for word, cmds in word_cmds.items():
+            if len(cmds) == 1:
+                folded.setdefault(sys.intern(word), next(iter(cmds)))
+        # sorted names allow binary searching for prefixes of clipped utterances
+        prefixes = sorted(folded)
+        # tokenize the launch commands once instead of on every launch
+        argv = {}
+        for cmd in set(apps.values()):
+            try:
+                argv[cmd] = shlex.split(cmd)
+            except ValueError as e:
+                LOG.warning(f"Invalid command '{cmd}': {e}")
+        # a single assignment, a concurrent utterance never sees a half built index
+        self._index = AppIndex(apps, folded, choices, prefixes, argv, {})
+
+    @property
+    def applist(self) -> Dict[str, str]:
+        """Application names and aliases mapped to their commands."""
+        return self._index.apps
+
+    def get_index(self) -> AppIndex:
+        """Current application index, waits for the initial scan if an utterance arrives before it finished."""
+        self._apps_ready.wait()
+        return self._index
+
+    def load_applist(self, use_cache: bool = True) -> Dict[str, str]:
+        """Load the application aliases from the disk cache, rescanning .desktop files only if anything changed."""
+        cache_file = join(xdg_cache_home(), CACHE_DIR, "applist.json")
+        # application dirs change when apps are (un)installed, settings/langs change the parsed aliases
+        key = hashlib.sha1(json.dumps([_APPLIST_CACHE_VERSION, self._apps_mtime, self.settings, self.native_langs],
+                                      sort_keys=True).encode("utf-8")).hexdigest()
+        if use_cache:
+            try:
+                with open(cache_file) as f:
+                    cached = json.load(f)
+                if cached.get("key") == key:
+                    LOG.debug(f"loaded application aliases from cache: {cache_file}")
+                    return cached["apps"]
+            except Exception:
+                pass  # missing or corrupted cache
+
+        apps = self.get_app_aliases()
+        try:
+            _write_cache(cache_file, json.dumps({"key": key, "apps": apps}).encode("utf-8"))
+        except Exception as e:
+            LOG.warning(f"Failed to cache application aliases: {e}")
+        return apps
+
+    def match_prefix(self, query: str, index: Optional[AppIndex] = None) -> Optional[str]:
+        """Complete a clipped application name, eg. "firef", if it is the prefix of a single command.
+
+        Args:
+            query: The folded spoken name, at least 4 characters long to be considered.
+            index: The application index to search, defaults to the current one.
+
+        Returns:
+            The command all names starting with the query point to, None if missing or ambiguous.
+        """
+        if len(query) < 4:
+            return None
+        if index is None:
+            index = self.get_index()
+        prefixes = index.prefixes
+        cmds = set()
+        idx = bisect_left(prefixes, query)
+        while idx < len(prefixes) and prefixes[idx].startswith(query):
+            cmds.add(index.folded[prefixes[idx]])
+            idx += 1
+        if len(cmds) == 1:
+            return cmds.pop()
+        return None
+
+    def fuzzy_choices(self, query: str, cutoff: float, index: Optional[AppIndex] = None) -> List[str]:
+        """Names whose length still allows a WRatio score above the cutoff.
+
+        WRatio scales partial matches by 0.9 when the lengths differ by 1.5x or more,
+        and by 0.6 when they differ by more than 8x, those names can be skipped without scoring.
+        The names are taken from the given application index, defaults to the current one.
+        """
+        if index is None:
+            index = self.get_index()
+        size = len(query)
+        if not size:
+            return []
+        if cutoff > 90:
+            lo, hi = size / 1.5, size * 1.5
+            in_band = lambda n: lo < n < hi
+        elif cutoff > 60:
+            lo, hi = size / 8, size * 8
+            in_band = lambda n: lo <= n <= hi
+        else:
+            in_band = lambda n: True
+        return [name for n, names in index.choices.items() if in_band(n) for name in names]
+
+    def match_command(self, app: str, index: Optional[AppIndex] = None) -> Tuple[Optional[str], float]:
+        """Find the command of the known application that best matches a spoken name.
+
+        Args:
+            app: The spoken name of the application.
+            index: The application index to search, defaults to the current one.
+
+        Returns:
+            A tuple of the matched command (None if nothing reaches the threshold) and a score between 0 and 1.
+        """
+        if index is None:
+            index = self.get_index()
+        # collapse whitespace too, "firefox  web browser" and "firefox web browser " share cache entries
+        query = " ".join(_fold(app).split())
+        cmd = index.folded.get(query)
+        if cmd:
+            return cmd, 1.0
+        cmd = self.match_prefix(query, index)
+        if cmd:
+            return cmd, 1.0
+        cutoff = self.settings.get("thresh", 0.85) * 100
+        # fuzzy results (misses included) are remembered until the next rebuild of the app list
+        fuzzy_cache = index.fuzzy_cache
+        if (query, cutoff) in fuzzy_cache:
+            return fuzzy_cache[(query, cutoff)]
+        # choices are folded already, skip rapidfuzz's default processor
+        # the cutoff lets rapidfuzz discard most choices without a full score computation
+        best = process.extractOne(query, self.fuzzy_choices(query, cutoff, index), scorer=fuzz.WRatio,
+                                  processor=None, score_cutoff=cutoff)
+        if best is None:
+            match = None, 0.0
+        else:
+            name, score, _ = best
+            match = index.folded[name], score / 100
+        if len(fuzzy_cache) >= 256:
+            fuzzy_cache.clear()
+        fuzzy_cache[(query, cutoff)] = match
+        return match
+
     def get_app_aliases(self) -> Dict[str, str]:
         """Fetch application aliases based on desktop files and settings."""
-        apps = self.settings.get("user_commands") or {}
-        norm = lambda k: k.replace(".desktop", "").replace("-", " ").replace("_", " ").split(".")[-1].title()
+        apps: Dict[str, str] = {}
+        aliases = self.settings.get("aliases", {})
 
         for app in self.get_desktop_apps(
                 skip_categories=self.settings.get("skip_categories",
@@ -229,27 +695,38 @@ class ApplicationLauncherSkill(FallbackSkill):
                 require_icon=self.settings.get("require_icon", True),
                 require_categories=self.settings.get("require_categories", True)
         ):
-            cmd = app["Exec"].split(" ")[0].split("/")[-1].split(".")[0]
-            names = [cmd]
+            # resolve quoting and field codes once here instead of on every launch
+            try:
+                argv = _parse_exec(app["Exec"])
+            except ValueError as e:
+                LOG.warning(f"Skipping {app.get('Name')}: {e}")
+                continue
+            if not argv:
+                continue
+            # stored as a shell quoted string, build_applist splits it back into the same argv
+            cmd = " ".join(shlex.quote(a) for a in argv)
+            binary = _executable_name(argv)
+            names = {binary, _normalize_name(binary)}
             for k, v in app.items():
                 if k.startswith("Name"):
-                    names.append(v)
-            names += [norm(n) for n in names]
-
-            for name in set(names):
-                if 3 <= len(name) <= 20:
-                    apps[name] = cmd
-                # speech friendly aliases
-                if name in self.settings.get("aliases", {}):
-                    for alias in self.settings["aliases"][name]:
-                        apps[alias] = cmd
-                # KDE likes to replace every C with a K
-                if name.startswith("K") and "KDE" in app.get("Categories", []):
-                    alias = "C" + name[1:]
-                    if alias not in apps:
-                        apps[alias] = cmd
+                    names.add(v)
+                    names.add(_normalize_name(v))
+
+            # only names of a speakable length are used directly
+            apps.update({name: cmd for name in names if 3 <= len(name) <= 20})
+            # speech friendly aliases
+            for name in names.intersection(aliases):
+                for alias in aliases[name]:
+                    apps[alias] = cmd
+            # KDE likes to replace every C with a K
+            if "KDE" in app.get("Categories", []):
+                for name in names:
+                    if name.startswith("K"):
+                        apps.setdefault("C" + name[1:], cmd)
             LOG.debug(f"found app {app['Name']} with aliases: {names}")
 
+        # user defined commands are applied last, they always override scanned applications
+        apps.update(self.settings.get("user_commands") or {})
         return apps
 
     @staticmethod
@@ -263,47 +740,49 @@ class ApplicationLauncherSkill(FallbackSkill):
         Returns:
             A dictionary containing the parsed application metadata.
         """
-        extra_langs = extra_langs or []
-        extra_langs = [standardize_lang_tag(l) for l in extra_langs]
-
-        config = configparser.ConfigParser(interpolation=None, delimiters=('=', ':'))
-        config.optionxform = str  # To keep case-sensitivity of keys
-        config.read(file_path)
+        keys_of_interest = _desktop_keys(tuple(extra_langs or ()))
 
         data = {}
 
         LIST_KEYS = ["Categories", "Keywords", "MimeType"]
         LIST_DELIM = ";"
-        if 'Desktop Entry' in config:
-            keys = config['Desktop Entry'].keys()
-            for key in keys:
-                v = config['Desktop Entry'].get(key)
-                if key in LIST_KEYS:
-                    v = [v for v in v.split(LIST_DELIM) if v]
-
-                if "[" in key:
-                    l = standardize_lang_tag(key.split("[")[-1].split("]")[0])
-                    k = key.split("[")[0]
-                    key = f"{k}[{l}]"
-
-                data[key] = v
-
-        keys_of_interest = [
-            'Name',
-            'GenericName',
-            "Categories",
-            "Comment",
-            'Keywords',
-            "Exec",
-            "Type",
-            #   'MimeType', # for future usage
-            'Icon',  # future usage in a UI
-            #   'DBusActivatable'  # for future usage instead of subprocess
-        ]
-        for l in extra_langs:
-            keys_of_interest += [f"Name[{l}]", f"GenericName[{l}]", f"Comment[{l}]"]
-
-        return {k: v for k, v in data.items() if k in keys_of_interest}
+        try:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            LOG.error(f"Failed to read {file_path}: {e}")
+            return data
+        # cheap byte level check, don't decode and parse entries that can't be launchable applications
+        if b"Exec" not in raw or b"Application" not in raw:
+            return data
+        lines = raw.decode("utf-8", errors="replace").split("\n")
+
+        # single pass line parser, we only need a handful of keys from the [Desktop Entry] group
+        in_section = False
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("["):
+                if in_section:
+                    break  # [Desktop Entry] is over, other groups are actions
+                in_section = line == "[Desktop Entry]"
+                continue
+            if not in_section:
+                continue
+            key, _, v = line.partition("=")
+            key = key.strip()
+            if key.endswith("]"):
+                l = _standardize_lang(key.split("[")[-1][:-1])
+                key = f"{key.split('[')[0]}[{l}]"
+            if key not in keys_of_interest:
+                continue
+            v = v.strip()
+            if key in LIST_KEYS:
+                v = [v for v in v.split(LIST_DELIM) if v]
+            data[key] = v
+
+        return data
 
     @staticmethod
     def get_desktop_apps(
@@ -331,56 +810,86 @@ class ApplicationLauncherSkill(FallbackSkill):
         Yields:
             Dictionaries containing metadata of matching desktop applications.
         """
-        for p in ["/usr/share/applications/", "/usr/local/share/applications/",
-                  expanduser("~/.local/share/applications/")]:
+        # sets for O(1) membership tests
+        skip_categories = frozenset(skip_categories)
+        skip_keywords = frozenset(skip_keywords)
+        target_categories = frozenset(target_categories)
+        target_keywords = frozenset(target_keywords)
+        blacklist = frozenset(blacklist)
+
+        files = []
+        for p in map(expanduser, APPLICATION_DIRS):
             if not isdir(p):
                 continue
-            for f in listdir(p):
-                if not f.endswith(".desktop") or f in blacklist:
-                    continue
-                file_path = join(p, f)
-
-                app_info = ApplicationLauncherSkill.parse_desktop_file(file_path, extra_langs=extra_langs)
-
-                if not app_info:
-                    continue
-                if "Exec" not in app_info:
-                    continue
-                if app_info["Name"] in blacklist:
-                    continue
-                if app_info.get("Type") != "Application":
-                    continue
-                if "Icon" not in app_info and require_icon:
-                    continue
-                if "Categories" not in app_info and (target_categories or require_categories):
-                    continue
-                if "Keywords" not in app_info and target_keywords:
-                    continue
+            with os.scandir(p) as entries:
+                # DirEntry caches the file type, the only stat() per file is for the mtime of the parse cache
+                files += [(e.path, e.stat().st_mtime_ns) for e in entries
+                          if e.name.endswith(".desktop") and e.name not in blacklist and e.is_file()]
+
+        # normalize the languages once, not for every parsed file
+        langs = tuple(sorted({_standardize_lang(l) for l in extra_langs or ()}))
+
+        def parse(entry: Tuple[str, int]) -> Dict[str, Union[str, List[str]]]:
+            path, mtime = entry
+            cached = _DESKTOP_CACHE.get(path)
+            if cached and cached[0] == (mtime, langs):
+                return cached[1]
+            app_info = ApplicationLauncherSkill.parse_desktop_file(path, extra_langs=langs)
+            _DESKTOP_CACHE[path] = ((mtime, langs), app_info)
+            return app_info
+
+        # parsing is I/O bound, overlap the file reads in a thread pool
+        with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as executor:
+            parsed = list(executor.map(parse, files))
+        # forget files that were removed or renamed since the last scan
+        for path in _DESKTOP_CACHE.keys() - {path for path, _ in files}:
+            _DESKTOP_CACHE.pop(path, None)
+
+        for app_info in parsed:
+            if not app_info:
+                continue
+            if "Exec" not in app_info:
+                continue
+            if app_info.get("Name") in blacklist:
+                continue
+            if app_info.get("Type") != "Application":
+                continue
+            if "Icon" not in app_info and require_icon:
+                continue
+            if "Categories" not in app_info and (target_categories or require_categories):
+                continue
+            if "Keywords" not in app_info and target_keywords:
+                continue
 
-                if skip_categories and any(c in skip_categories for c in app_info.get("Categories", [])):
-                    continue
-                if skip_keywords and any(c in skip_keywords for c in app_info.get("Keywords", [])):
-                    continue
+            if not skip_categories.isdisjoint(app_info.get("Categories", ())):
+                continue
+            if not skip_keywords.isdisjoint(app_info.get("Keywords", ())):
+                continue
+            if target_categories and target_categories.isdisjoint(app_info["Categories"]):
+                continue
+            if target_keywords and target_keywords.isdisjoint(app_info["Keywords"]):
+                continue
 
-                yield app_info
+            yield app_info
 
     #########
     # Window management
     def match_window(self, app: str) -> List[WindowMatch]:
         windows = self.get_window_process_mapping()
-        candidates = []
-        best = 0
-        for win in windows:
-            score = max(fuzzy_match(win[1].name(), app),
-                        fuzzy_match(win[-1], app))  # pick best match, process name or window name
-            if score < self.settings.get("thresh", 0.85):
-                continue
-            if score > best:
-                candidates = []
-            if score >= best:
-                candidates.append(win)
-                best = score
-        return candidates
+        thresh = self.settings.get("thresh", 0.85) * 100
+        # score all process names and window titles in batch, keep the best of both per window
+        query = app.casefold()
+        scores = [0.0] * len(windows)
+        for choices in ([(win[1].info['name'] or "").casefold() for win in windows],
+                        [win[-1].casefold() for win in windows]):
+            for _, score, idx in process.extract(query, choices, scorer=fuzz.ratio, processor=None,
+                                                 score_cutoff=thresh, limit=None):
+                scores[idx] = max(scores[idx], score)
+
+        best = max(scores, default=0)
+        if not best:  # nothing above threshold
+            return []
+        return [win for win, score in zip(windows, scores) if score == best]
 
     def close_by_window(self, app: str) -> bool:
 
@@ -399,6 +908,7 @@ class ApplicationLauncherSkill(FallbackSkill):
         return True
 
     def switch_window(self, window_id) -> bool:
+        self._wmcache_t = 0.0  # window list is about to change
         try:
             result = subprocess.run([self.wmctrl, '-iR', window_id])
             if result.returncode == 0:
@@ -410,6 +920,7 @@ class ApplicationLauncherSkill(FallbackSkill):
         return False
 
     def close_window(self, window_id) -> bool:
+        self._wmcache_t = 0.0  # window list is about to change
         try:
             result = subprocess.run([self.wmctrl, '-ic', window_id])
             if result.returncode == 0:
@@ -421,33 +932,49 @@ class ApplicationLauncherSkill(FallbackSkill):
         return False
 
     def get_window_process_mapping(self) -> List[WindowMatch]:
-        """Get a mapping of window objects to process objects on Linux."""
+        """Get a mapping of window objects to process objects on Linux, cached for 1 second."""
+        if time.monotonic() - self._wmcache_t < 1.0:
+            return self._wmcache
+        self._wmcache = self._get_window_process_mapping()
+        self._wmcache_t = time.monotonic()
+        return self._wmcache
+
+    def _get_window_process_mapping(self) -> List[WindowMatch]:
         windows = []
 
         try:
             # Get the list of windows with wmctrl
-            result = subprocess.run([self.wmctrl, '-lp'], capture_output=True, text=True)
+            result = subprocess.run([self.wmctrl, '-lp'], capture_output=True)
             # windows are returned sorted by order of creation, but we dont have that timestamp
             # TODO - is this true or just coincidence in my tests? i don't think it is ensured
             if result.returncode != 0:
                 LOG.error("wmctrl command failed.")
                 return []
 
-            # Process each line in the wmctrl output
+            # read all processes in a single pass instead of one psutil.Process lookup per window
+            processes = {p.pid: p for p in psutil.process_iter(['name', 'create_time'])}
+
+            # Process each line in the wmctrl output, only the window title needs decoding
             for line in result.stdout.splitlines():
                 # wmctrl output format: 0x04400007  0  12345  <hostname>  <window_title>
                 fields = line.split()
-                window_id = fields[0]  # Window ID
-                pid = fields[2]  # Process ID (PID)
-
-                window_title = " ".join(fields[4:])  # Window title (everything after hostname)
+                if len(fields) < 4:
+                    continue
                 try:
-                    # Get process object using the PID
-                    process = psutil.Process(int(pid))
-                    # Map window ID to the process object
-                    windows.append((window_id, process, process.create_time(), window_title))
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    window_id = fields[0].decode()  # Window ID
+                    pid = int(fields[2])  # Process ID (PID)
+                except ValueError:
+                    # a single malformed line shouldn't drop every other window
+                    LOG.debug(f"Skipping malformed wmctrl line: {line}")
+                    continue
+
+                window_title = b" ".join(fields[4:]).decode("utf-8", errors="replace")  # everything after hostname
+                process = processes.get(pid)
+                if process is None:
                     LOG.error(f"Unable to retrieve process for PID: {pid}")
+                    continue
+                # Map window ID to the process object
+                windows.append((window_id, process, process.info['create_time'], window_title))
 
         except Exception as e:
             LOG.error(f"Error retrieving window-process mapping: {e}")
@@ -456,8 +983,6 @@ class ApplicationLauncherSkill(FallbackSkill):
 
 
 if __name__ == "__main__":
-    import time
-
     LOG.set_level("DEBUG")
     from ovos_utils.fakebus import FakeBus
     from ovos_bus_client.message import Message
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ovos_utils.fakebus import FakeBus
+
+from ovos_skill_application_launcher import ApplicationLauncherSkill
+
+APPS = {
+    "Firefox Web Browser": "firefox",
+    "GNOME System Monitor": "gnome-system-monitor",
+    "KDE Task Manager": "ksysguard",
+    "KDE Partition Manager": "partitionmanager",
+}
+
+
+class TestApplist(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.env = patch.dict(os.environ, {"XDG_CACHE_HOME": cls.tmp.name})
+        cls.env.start()
+        cls.aliases = patch.object(ApplicationLauncherSkill, "get_app_aliases", lambda self: dict(APPS))
+        cls.aliases.start()
+        cls.skill = ApplicationLauncherSkill(skill_id="ovos-skill-application-launcher.test", bus=FakeBus())
+        cls.skill.handle_refresh_apps(None)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.skill.default_shutdown()
+        cls.aliases.stop()
+        cls.env.stop()
+        cls.tmp.cleanup()
+
+    def test_full_name(self):
+        self.assertEqual(self.skill.match_command("firefox web browser"), ("firefox", 1.0))
+
+    def test_unique_word(self):
+        self.assertEqual(self.skill.match_command("firefox"), ("firefox", 1.0))
+        self.assertEqual(self.skill.match_command("partition"), ("partitionmanager", 1.0))
+
+    def test_shared_word(self):
+        # "manager" belongs to two different apps, it must not be an exact hit for either
+        self.assertNotIn("manager", self.skill.get_index().folded)
+        self.assertNotIn("kde", self.skill.get_index().folded)
+        cmd, score = self.skill.match_command("manager")
+        self.assertLess(score, 1.0)
+
+    def test_match_app_keeps_case(self):
+        res = self.skill.match_app("Open Firefox Web Browser", "en-US")
+        self.assertEqual(res["name"], "launch")
+        self.assertEqual(res["entities"]["application"], "Firefox Web Browser")
+
+    def test_index_snapshot(self):
+        old = self.skill.get_index()
+        with patch.object(ApplicationLauncherSkill, "load_applist", lambda self, use_cache=True: {"Kate": "kate"}):
+            self.skill.build_applist()
+        try:
+            # lookups against a snapshot are unaffected by a rescan swapping the index
+            self.assertEqual(self.skill.match_command("firefx web browser", old)[0], "firefox")
+            self.assertEqual(self.skill.match_command("firefx web browser")[0], None)
+            self.assertEqual(self.skill.match_command("kate"), ("kate", 1.0))
+        finally:
+            self.skill.handle_refresh_apps(None)
+
+    def test_failed_scan_is_retried(self):
+        skill = self.skill
+        with patch.object(ApplicationLauncherSkill, "load_applist", side_effect=OSError("unreadable")):
+            skill._load_apps()
+        self.assertIsNone(skill._apps_mtime)
+        # the next refresh rescans even though the application dirs didn't change
+        skill.refresh_applist()
+        self.assertEqual(skill.match_command("firefox"), ("firefox", 1.0))
+        self.assertIsNotNone(skill._apps_mtime)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import shlex
+import unittest
+
+from ovos_skill_application_launcher import _executable_name, _parse_exec
+
+
+class TestParseExec(unittest.TestCase):
+    def test_field_codes(self):
+        self.assertEqual(_parse_exec("firefox %u"), ["firefox"])
+        self.assertEqual(_parse_exec("gimp-2.10 %U"), ["gimp-2.10"])
+        self.assertEqual(_parse_exec("app --file=%f --verbose"), ["app", "--file=", "--verbose"])
+
+    def test_percent_escape(self):
+        self.assertEqual(_parse_exec("printf 100%%f"), ["printf", "100%f"])
+        self.assertEqual(_parse_exec("printf %%"), ["printf", "%"])
+
+    def test_quoting(self):
+        self.assertEqual(_parse_exec('"/opt/My App/app" --name="My App" %F'),
+                         ["/opt/My App/app", "--name=My App"])
+        self.assertEqual(_parse_exec('sh -c "echo \\"hi\\" \\$HOME"'), ["sh", "-c", 'echo "hi" $HOME'])
+        self.assertEqual(_parse_exec('app ""'), ["app", ""])
+
+    def test_string_escapes(self):
+        # the general string escapes are resolved before the quoting rules
+        self.assertEqual(_parse_exec('app "a\\\\"b"'), ["app", 'a"b'])
+        self.assertEqual(_parse_exec('app "a\\sb"'), ["app", "a b"])
+
+    def test_unterminated_quote(self):
+        with self.assertRaises(ValueError):
+            _parse_exec('app "unterminated')
+
+    def test_shell_roundtrip(self):
+        argv = _parse_exec('"/opt/My App/app" --title="it\'s" %u')
+        cmd = " ".join(shlex.quote(a) for a in argv)
+        self.assertEqual(shlex.split(cmd), argv)
+
+
+class TestExecutableName(unittest.TestCase):
+    def test_plain(self):
+        self.assertEqual(_executable_name(["/usr/lib/firefox/firefox"]), "firefox")
+        self.assertEqual(_executable_name(["/opt/foo/foo.bin", "--bar"]), "foo")
+
+    def test_env(self):
+        self.assertEqual(_executable_name(["env", "GDK_BACKEND=x11", "-u", "QT_QPA", "/usr/bin/kate"]), "kate")
+        self.assertEqual(_executable_name(["/usr/bin/env", "-i", "FOO=1", "vlc", "--started-from-file"]), "vlc")
+
+    def test_flatpak(self):
+        self.assertEqual(_executable_name(["/usr/bin/flatpak", "run", "--branch=stable", "--arch=x86_64",
+                                           "org.mozilla.firefox"]), "firefox")
+        self.assertEqual(_executable_name(["flatpak", "run", "--command=gimp-2.10", "org.gimp.GIMP"]), "gimp-2")
+        self.assertEqual(_executable_name(["env", "FOO=1", "flatpak", "run", "org.videolan.VLC"]), "VLC")
+
+    def test_empty(self):
+        self.assertEqual(_executable_name([]), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import ovos_skill_application_launcher as launcher
+from ovos_skill_application_launcher import ApplicationLauncherSkill
+
+ENTRY = """[Desktop Entry]
+Type=Application
+Name={name}
+Exec={name} %u
+Icon={name}
+Categories=Utility;
+"""
+
+
+class TestDesktopFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        for name in ("foo", "bar"):
+            with open(os.path.join(self.tmp.name, f"{name}.desktop"), "w") as f:
+                f.write(ENTRY.format(name=name))
+        self.dirs = patch.object(launcher, "APPLICATION_DIRS", [self.tmp.name])
+        self.dirs.start()
+
+    def tearDown(self):
+        self.dirs.stop()
+        self.tmp.cleanup()
+
+    def get_apps(self):
+        return [app["Name"] for app in ApplicationLauncherSkill.get_desktop_apps(
+            skip_categories=[], skip_keywords=[], target_categories=[], target_keywords=[], blacklist=[],
+            extra_langs=None, require_icon=True, require_categories=True)]
+
+    def test_removed_files_are_pruned(self):
+        self.assertEqual(sorted(self.get_apps()), ["bar", "foo"])
+        removed = os.path.join(self.tmp.name, "bar.desktop")
+        self.assertIn(removed, launcher._DESKTOP_CACHE)
+        os.remove(removed)
+        self.assertEqual(self.get_apps(), ["foo"])
+        self.assertNotIn(removed, launcher._DESKTOP_CACHE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+import unittest
+
+from ovos_skill_application_launcher import _fold
+
+
+class TestFold(unittest.TestCase):
+    def test_latin_greek_cyrillic(self):
+        self.assertEqual(_fold("Écran"), "ecran")
+        self.assertEqual(_fold("FIRÉFOX"), "firefox")
+        self.assertEqual(_fold("Ἄλφα"), "αλφα")
+        self.assertEqual(_fold("Ёлка"), "елка")
+
+    def test_other_scripts_are_kept(self):
+        # devanagari nukta and virama change the letter, they must not be stripped
+        for name in ("फ़ोन", "क्ष", "한글", "日本語"):
+            self.assertEqual(_fold(name), name)
+        self.assertNotEqual(_fold("फ़ोन"), _fold("फोन"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import os
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from ovos_skill_application_launcher import ApplicationLauncherSkill
+
+
+class TestWindowProcessMapping(unittest.TestCase):
+    def get_mapping(self, stdout: bytes):
+        skill = SimpleNamespace(wmctrl="/usr/bin/wmctrl")
+        result = SimpleNamespace(returncode=0, stdout=stdout)
+        with patch("ovos_skill_application_launcher.subprocess.run", return_value=result):
+            return ApplicationLauncherSkill._get_window_process_mapping(skill)
+
+    def test_malformed_lines_are_skipped(self):
+        pid = os.getpid()
+        stdout = (f"0x04400007  0 {pid}  host  First Window\n"
+                  f"0x04400008  0 notapid  host  Broken\n"
+                  f"0x04400009  0\n"
+                  f"0x0440000a  0 {pid}  host  Second  Window\n").encode()
+        windows = self.get_mapping(stdout)
+        # most recent window first
+        self.assertEqual([(w[0], w[1].pid, w[3]) for w in windows],
+                         [("0x0440000a", pid, "Second Window"), ("0x04400007", pid, "First Window")])
+
+
+if __name__ == "__main__":
+    unittest.main()